@@ -1,7 +1,70 @@
 from __future__ import annotations
 
-from .calibrate_beamshift import CalibBeamShift
-from .calibrate_brightness import CalibBrightness
-from .calibrate_directbeam import CalibDirectBeam
-from .calibrate_stage_lowmag import CalibStage
-# from .calibrate_stage_mag1 import CalibStageMag1
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+from instamatic.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from .calibrate_beamshift import CalibBeamShift
+    from .calibrate_brightness import CalibBrightness
+    from .calibrate_directbeam import CalibDirectBeam
+    from .calibrate_stage_lowmag import CalibStage
+
+__all__ = [
+    'CalibBeamShift',
+    'CalibBrightness',
+    'CalibDirectBeam',
+    'CalibStage',
+]
+
+_lazy_attrs = {
+    'CalibBeamShift': '.calibrate_beamshift',
+    'CalibBrightness': '.calibrate_brightness',
+    'CalibDirectBeam': '.calibrate_directbeam',
+    'CalibStage': '.calibrate_stage_lowmag',
+    # 'CalibStageMag1': '.calibrate_stage_mag1',
+}
+
+__getattr__, __dir__ = attach(__name__, _lazy_attrs)
+
+
+# Subcommands for `instamatic.calibrate`, mapped to the module providing `main_entry`
+_commands = {
+    'beamshift': 'instamatic.calibrate.calibrate_beamshift',
+    'brightness': 'instamatic.calibrate.calibrate_brightness',
+    'directbeam': 'instamatic.calibrate.calibrate_directbeam',
+    'stage_lowmag': 'instamatic.calibrate.calibrate_stage_lowmag',
+    'stage_mag1': 'instamatic.calibrate.calibrate_stage_mag1',
+    'stagematrix': 'instamatic.calibrate.calibrate_stagematrix',
+    'flatfield': 'instamatic.processing.flatfield',
+}
+
+
+def main_entry():
+    import argparse
+
+    description = """Run one of the calibration routines. All arguments after the name of the routine are passed on to it, use `instamatic.calibrate NAME -h` to show its options."""
+
+    parser = argparse.ArgumentParser(
+        description=description, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        'command',
+        type=str,
+        choices=list(_commands),
+        metavar='NAME',
+        help='Calibration routine to run, one of: ' + ', '.join(_commands),
+    )
+
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+
+    options = parser.parse_args()
+
+    # only import the routine that was asked for
+    module = importlib.import_module(_commands[options.command])
+
+    sys.argv = [f'{parser.prog} {options.command}', *options.args]
+    module.main_entry()
@@ -5,7 +5,6 @@ import os
 import pickle
 import sys
 
-import matplotlib.pyplot as plt
 import numpy as np
 from skimage.registration import phase_cross_correlation
 
@@ -84,6 +83,8 @@ class CalibBeamShift:
         pickle.dump(self, open(fout, 'wb'))
 
     def plot(self, to_file=None, outdir=''):
+        import matplotlib.pyplot as plt
+
         if not self.has_data:
             return
 
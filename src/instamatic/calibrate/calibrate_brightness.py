@@ -4,7 +4,6 @@ import logging
 import pickle
 import sys
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from instamatic.image_utils import autoscale
@@ -61,6 +60,8 @@ class CalibBrightness:
         pickle.dump(self, open(fn, 'wb'))
 
     def plot(self):
+        import matplotlib.pyplot as plt
+
         if not self.has_data:
             pass
 
@@ -5,7 +5,6 @@ import os
 import pickle
 import sys
 
-import matplotlib.pyplot as plt
 import numpy as np
 from skimage.registration import phase_cross_correlation
 
@@ -160,6 +159,8 @@ class CalibDirectBeam:
         self._dct[key] = dct
 
     def plot(self, key, to_file=None, outdir=''):
+        import matplotlib.pyplot as plt
+
         data_shifts = self._dct[key]['data_shifts']  # pixelshifts
         data_readout = self._dct[key]['data_readout']  # microscope readout
 
@@ -4,7 +4,6 @@ import logging
 import pickle
 import sys
 
-import matplotlib.pyplot as plt
 import numpy as np
 from skimage.registration import phase_cross_correlation
 
@@ -213,6 +212,8 @@ class CalibStage:
         pickle.dump(self, open(fn, 'wb'))
 
     def plot(self):
+        import matplotlib.pyplot as plt
+
         if not self.has_data:
             return
 
@@ -2,17 +2,16 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
 import yaml
-from scipy import stats
+from scipy import fft
 from skimage.registration import phase_cross_correlation
 
 from instamatic import config
 from instamatic.calibrate.fit import fit_affine_transformation
 from instamatic.formats import read_tiff, write_tiff
 from instamatic.image_utils import rotate_image
-from instamatic.io import get_new_work_subdirectory
+from instamatic.io import SafeDumper, get_new_work_subdirectory
 
 np.set_printoptions(suppress=True)
 
@@ -30,6 +29,8 @@ def get_outlier_filter(data, threshold: float = 2.0) -> list:
     `threshold` defines the cut-off value for which zscores are still
     accepted as an inlier. Returns an boolean numpy array.
     """
+    from scipy import stats
+
     zscore = stats.zscore(np.linalg.norm(data, axis=1))
     sel = abs(zscore) < threshold
 
@@ -39,17 +40,58 @@ def get_outlier_filter(data, threshold: float = 2.0) -> list:
     return sel
 
 
-def cross_correlate_image_pairs(pairs: tuple) -> list:
-    """Cross correlate image pairs."""
+def rfft_translation(fft0: np.ndarray, fft1: np.ndarray, shape: tuple) -> np.ndarray:
+    """Find the whole-pixel translation between two images from their real-
+    input Fourier transforms (`rfft2`) by phase correlation.
+
+    This follows the conventions of `phase_cross_correlation` with
+    `upsample_factor=1`, but only needs half of the spectrum.
+    """
+    image_product = fft0 * fft1.conj()
+    eps = np.finfo(image_product.real.dtype).eps
+    image_product /= np.maximum(np.abs(image_product), 100 * eps)
+    cross_correlation = fft.irfft2(image_product, s=shape)
+
+    maxima = np.unravel_index(np.argmax(np.abs(cross_correlation)), shape)
+    midpoint = np.array([axis_size // 2 for axis_size in shape])
+
+    translation = np.array(maxima, dtype=float)
+    translation[translation > midpoint] -= np.array(shape)[translation > midpoint]
+    return translation
+
+
+def cross_correlate_image_pairs(pairs: tuple, upsample_factor: int = 10) -> list:
+    """Cross correlate image pairs.
+
+    The cross correlation is done in Fourier space in single precision.
+    Consecutive pairs usually share an image (`(img0, img1), (img1,
+    img2), ...`), in which case its Fourier transform is reused. With
+    `upsample_factor=1` only whole-pixel translations are determined,
+    for which the real-input transforms are sufficient.
+    """
+    subpixel = upsample_factor > 1
+    transform = fft.fft2 if subpixel else fft.rfft2
+
     translations = []
+    last_img = last_fft = None
     for img0, img1 in pairs:
-        translation, error, phasediff = phase_cross_correlation(img0, img1, upsample_factor=10)
-        print(f'shift {translation} error {error:.4f} phasediff {phasediff:.4f}')
+        fft0 = last_fft if img0 is last_img else transform(img0.astype(np.float32))
+        fft1 = transform(img1.astype(np.float32))
+        last_img, last_fft = img1, fft1
+
+        if subpixel:
+            translation, error, phasediff = phase_cross_correlation(
+                fft0, fft1, space='fourier', upsample_factor=upsample_factor
+            )
+            print(f'shift {translation} error {error:.4f} phasediff {phasediff:.4f}')
+        else:
+            translation = rfft_translation(fft0, fft1, img0.shape)
+            print(f'shift {translation}')
         translations.append(translation)
     return translations
 
 
-def calibrate_stage_from_file(drc: str, plot: bool = False):
+def calibrate_stage_from_file(drc: str, plot: bool = False, upsample_factor: int = 10):
     """Calibrate the stage from the saved log/tiff files. This is essentially
     the same function as below, with the exception that it reads the `log.yaml`
     to recalculate the stage matrix.
@@ -60,6 +102,9 @@ def calibrate_stage_from_file(drc: str, plot: bool = False):
         Directory containing the `log.yaml` and tiff files.
     plot : bool
         Plot the results of the fitting.
+    upsample_factor : int
+        Images are registered to within `1 / upsample_factor` of a pixel.
+        Use 1 for whole-pixel cross correlation, which is faster.
 
     Returns
     -------
@@ -90,7 +135,7 @@ def calibrate_stage_from_file(drc: str, plot: bool = False):
 
             last_img = img
 
-    translations = cross_correlate_image_pairs(pairs)
+    translations = cross_correlate_image_pairs(pairs, upsample_factor=upsample_factor)
 
     # Filter outliers
     sel = get_outlier_filter(translations)
@@ -103,6 +148,8 @@ def calibrate_stage_from_file(drc: str, plot: bool = False):
     t = fit_result.t
 
     if plot:
+        import matplotlib.pyplot as plt
+
         r_i = np.linalg.inv(r)
         translations_ = np.dot(stage_shifts, r_i)
 
@@ -121,6 +168,7 @@ def calibrate_stage_from_stageshifts(
     *args,
     plot: bool = False,
     drc=None,
+    upsample_factor: int = 10,
 ) -> np.array:
     """Run the calibration algorithm on the given X/Y ranges. An image will be
     taken at each position for cross correlation with the previous. An affine
@@ -139,6 +187,9 @@ def calibrate_stage_from_stageshifts(
         specified to be run in sequence.
     plot: bool
         Plot the fitting result.
+    upsample_factor: int
+        Images are registered to within `1 / upsample_factor` of a pixel.
+        Use 1 for whole-pixel cross correlation, which is faster.
 
     Returns
     -------
@@ -198,7 +249,7 @@ def calibrate_stage_from_stageshifts(
         # return to original position
         ctrl.stage.xy = (stage_x, stage_y)
 
-    translations = cross_correlate_image_pairs(pairs)
+    translations = cross_correlate_image_pairs(pairs, upsample_factor=upsample_factor)
 
     # Filter outliers
     sel = get_outlier_filter(translations)
@@ -224,9 +275,12 @@ def calibrate_stage_from_stageshifts(
             't': t,
             'binning': binning,
         }
-        yaml.dump(d, open(drc / 'log.yaml', 'w'))
+        with open(drc / 'log.yaml', 'w') as f:
+            yaml.dump(d, f, Dumper=SafeDumper)
 
     if plot:
+        import matplotlib.pyplot as plt
+
         r_i = np.linalg.inv(r)
         translations_ = np.dot(stage_shifts, r_i)
 
@@ -240,6 +294,15 @@ def calibrate_stage_from_stageshifts(
     return stagematrix
 
 
+def _get_n_steps(step: float, stage_length: int, min_n_step: int, max_n_step: int) -> int:
+    """Number of steps of size `step` needed to cover `stage_length`, bounded
+    by `min_n_step` and `max_n_step`."""
+    if step * min_n_step > stage_length:
+        return min_n_step
+    else:
+        return min(int(stage_length // step), max_n_step)
+
+
 def calibrate_stage(
     ctrl,
     mode: str = None,
@@ -250,6 +313,7 @@ def calibrate_stage(
     max_n_step: int = 15,
     plot: bool = False,
     drc: str = None,
+    upsample_factor: int = 10,
 ) -> np.array:
     """Calibrate the stage movement (nm) and the position of the camera
     (pixels) at a specific magnification.
@@ -280,6 +344,8 @@ def calibrate_stage(
         Plot the fitting result.
     drc: str
         Path to store the raw data (optional).
+    upsample_factor: int
+        Images are registered to within `1 / upsample_factor` of a pixel.
 
     Returns
     -------
@@ -306,15 +372,8 @@ def calibrate_stage(
     displacement = np.array(camera_shape) * pixelsize
     x_step, y_step = displacement * (1 - overlap)
 
-    if x_step * min_n_step > stage_length:
-        n_x_step = min_n_step
-    else:
-        n_x_step = min(int(stage_length // x_step), max_n_step)
-
-    if y_step * min_n_step > stage_length:
-        n_y_step = min_n_step
-    else:
-        n_y_step = min(int(stage_length // y_step), max_n_step)
+    n_x_step = _get_n_steps(x_step, stage_length, min_n_step, max_n_step)
+    n_y_step = _get_n_steps(y_step, stage_length, min_n_step, max_n_step)
 
     args = (
         (n_x_step, [x_step, 0.0]),
@@ -326,6 +385,7 @@ def calibrate_stage(
         *args,
         plot=plot,
         drc=drc,
+        upsample_factor=upsample_factor,
     )
 
     return stagematrix
@@ -340,6 +400,7 @@ def calibrate_stage_all(
     min_n_step: int = 5,
     max_n_step: int = 9,
     save: bool = False,
+    upsample_factor: int = 10,
 ) -> dict:
     """Run the stagematrix calibration routine for all magnifications
     specified. Return the updates values for the configuration file.
@@ -364,6 +425,8 @@ def calibrate_stage_all(
         calibration. This is used for higher magnifications.
     save: bool
         Save the data to the data directory.
+    upsample_factor: int
+        Images are registered to within `1 / upsample_factor` of a pixel.
 
     Returns
     -------
@@ -400,6 +463,7 @@ def calibrate_stage_all(
                     min_n_step=min_n_step,
                     max_n_step=max_n_step,
                     drc=drc,
+                    upsample_factor=upsample_factor,
                 )
             except ValueError as e:  # raises if pixelsize is 0 or 1.0
                 print(e)
@@ -503,6 +567,18 @@ The stagematrix takes the image binning into account."""
         ),
     )
 
+    parser.add_argument(
+        '-u',
+        '--upsample_factor',
+        dest='upsample_factor',
+        type=int,
+        metavar='N',
+        help=(
+            'Register the images to within 1/N of a pixel. With N=1, only '
+            'whole-pixel shifts are determined, which is faster.'
+        ),
+    )
+
     parser.add_argument(
         '-s',
         '--save',
@@ -518,6 +594,7 @@ The stagematrix takes the image binning into account."""
         stage_length=40_000,
         min_n_step=5,
         max_n_step=9,
+        upsample_factor=10,
         plot=False,
         drc=None,
         save=False,
@@ -542,6 +619,7 @@ The stagematrix takes the image binning into account."""
         'stage_length': options.stage_length,
         'min_n_step': options.min_n_step,
         'max_n_step': options.max_n_step,
+        'upsample_factor': options.upsample_factor,
     }
 
     if mode == 'all':
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections import namedtuple
 
-import lmfit
 import numpy as np
 
 FitResult = namedtuple('FitResult', 'r t angle sx sy tx ty k1 k2 params'.split())
@@ -45,6 +44,8 @@ def fit_affine_transformation(
         translation matrices to transform `a` to `b`. The raw parameters can
         be accessed through the corresponding attributes.
     """
+    import lmfit
+
     params = lmfit.Parameters()
     params.add('angle', value=x0.get('angle', 0), vary=rotation, min=-np.pi, max=np.pi)
     params.add('sx', value=x0.get('sx', 1), vary=scaling)
@@ -34,6 +34,22 @@ def read_image(fname: str) -> (np.array, dict):
     return img, h
 
 
+def read_image_header(fname: str) -> dict:
+    """Read only the header of an image, guess filetype by extension.
+
+    For TIFF and HDF5 files the image data are not read. Other formats
+    fall back to `read_image`.
+    """
+    ext = Path(fname).suffix.lower()
+    if ext in ('.tif', '.tiff'):
+        h = read_tiff_header(fname)
+    elif ext in ('.h5', '.hdf5'):
+        h = read_hdf5_header(fname)
+    else:
+        img, h = read_image(fname)
+    return h
+
+
 def write_tiff(fname: str, data, header: dict = None):
     """Simple function to write a tiff file.
 
@@ -71,6 +87,27 @@ def read_tiff(fname: str) -> (np.array, dict):
     page = tiff.pages[0]
     img = page.asarray()
 
+    header = _get_tiff_header(tiff, page)
+
+    return img, header
+
+
+def read_tiff_header(fname: str) -> dict:
+    """Read the header of a tiff file without reading the image data.
+
+    fname: str,
+        path or filename to image which should be opened
+
+    Returns:
+        header: dict
+            dictionary with all the tem parameters and image attributes
+    """
+    with tifffile.TiffFile(fname) as tiff:
+        return _get_tiff_header(tiff, tiff.pages[0])
+
+
+def _get_tiff_header(tiff: tifffile.TiffFile, page: tifffile.TiffPage) -> dict:
+    """Parse the header from the tags of tiff `page`."""
     if page.software == 'instamatic':
         header = yaml.load(page.tags['ImageDescription'].value, Loader=yaml.Loader)
     elif tiff.is_tvips:
@@ -78,7 +115,7 @@ def read_tiff(fname: str) -> (np.array, dict):
     else:
         header = {}
 
-    return img, header
+    return header
 
 
 def write_hdf5(fname: str, data, header: dict = None):
@@ -118,6 +155,24 @@ def read_hdf5(fname: str) -> (np.array, dict):
     return np.array(f['data']), dict(f['data'].attrs)
 
 
+def read_hdf5_header(fname: str) -> dict:
+    """Simple function to read the header of a hdf5 file written by Instamatic
+    without reading the image data.
+
+    fname: str,
+        path or filename to image which should be opened
+
+    Returns:
+        header: dict
+            dictionary with all the tem parameters and image attributes
+    """
+    if not os.path.exists(fname):
+        raise FileNotFoundError(f"No such file: '{fname}'")
+
+    with h5py.File(fname, 'r') as f:
+        return dict(f['data'].attrs)
+
+
 def read_cbf(fname: str):
     """CBF reader not implemented."""
     raise NotImplementedError('CBF reader not implemented.')
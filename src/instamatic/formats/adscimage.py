@@ -43,15 +43,17 @@ def write_adsc(fname: str, data: np.array, header: dict = {}):
 
     # NOTE: XDS can handle only "SMV" images of TYPE=unsigned_short.
     dtype = np.uint16
-    data = np.round(data, 0).astype(
+    if not np.issubdtype(data.dtype, np.integer):
+        data = np.round(data, 0)
+    data = data.astype(
         dtype, copy=False
     )  # copy=False ensures that no copy is made if dtype is already satisfied
     if swap_needed(header):
-        data.byteswap(True)
+        data = data.byteswap()  # not in-place, `data` may be the input array
 
     with open(fname, 'wb') as outf:
         outf.write(out)
-        outf.write(data.tobytes())
+        outf.write(np.ascontiguousarray(data))  # write the buffer directly, no bytes copy
 
 
 def readheader(infile):
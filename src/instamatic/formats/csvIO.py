@@ -3,7 +3,6 @@ from __future__ import annotations
 import io
 from collections import OrderedDict
 
-import pandas as pd
 import yaml
 
 
@@ -27,6 +26,8 @@ def write_csv(f, results):
 
 def read_csv(f):
     """Read a csv file into a pandas DataFrame."""
+    import pandas as pd
+
     if isinstance(f, (list, tuple)):
         return pd.concat(read_csv(csv) for csv in f)
     else:
@@ -43,6 +44,8 @@ def read_ycsv(f):
         ---
         $CSV_BLOCK
     """
+    import pandas as pd
+
     if isinstance(f, str):
         f = open(f)
 
@@ -710,7 +710,8 @@ def write_image(filename, img, index=None, header=None, inplace=False):
     if header is None and hasattr(img, 'header'):
         header = img.header
     try:
-        img = img.astype(mrc2numpy[numpy2mrc[img.dtype.type]])
+        # only copies if the dtype changes or `img` is not contiguous, `tofile` needs C order
+        img = img.astype(mrc2numpy[numpy2mrc[img.dtype.type]], order='C', copy=False)
     except BaseException:
         raise TypeError(f'Unsupported type for MRC writing: {img.dtype}')
 
@@ -12,7 +12,6 @@ import os
 
 import numpy
 import numpy as np
-from scipy import ndimage
 
 _logger = logging.getLogger(__name__)
 _logger.setLevel(logging.DEBUG)
@@ -135,6 +134,8 @@ def read_image(f, header, dtype, dlen, shape, swap, order='C'):
     out : ndarray
           Array of image data
     """
+    from scipy import ndimage
+
     out = np.fromfile(f, dtype=dtype, count=dlen)
     out.shape = shape
     out = out.squeeze()
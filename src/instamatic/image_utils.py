@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 import numpy as np
-from scipy import ndimage
-from skimage import exposure
 
 from instamatic import config
 
@@ -10,6 +8,8 @@ from instamatic import config
 def autoscale(img: np.ndarray, maxdim: int = 512) -> (np.ndarray, float):
     """Scale the image to fit the maximum dimension given by `maxdim` Returns
     the scaled image, and the image scale."""
+    from scipy import ndimage
+
     if maxdim:
         scale = float(maxdim) / max(img.shape)
 
@@ -20,6 +20,9 @@ def imgscale(img: np.ndarray, scale: float) -> np.ndarray:
     """Scale the image by the given scale."""
     if scale == 1:
         return img
+
+    from scipy import ndimage
+
     return ndimage.zoom(img, scale, order=1)
 
 
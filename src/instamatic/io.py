@@ -1,9 +1,33 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from pathlib import Path, PurePath
+
+import numpy as np
 
 from instamatic import config
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
+
+class SafeDumper(_SafeDumper):
+    """Safe YAML dumper using the libyaml C emitter if available.
+
+    Numpy arrays/scalars and paths are written as plain YAML types.
+    """
+
+
+SafeDumper.add_multi_representer(
+    np.ndarray, lambda dumper, data: dumper.represent_list(data.tolist())
+)
+SafeDumper.add_multi_representer(
+    np.generic, lambda dumper, data: dumper.represent_data(data.item())
+)
+SafeDumper.add_multi_representer(PurePath, lambda dumper, data: dumper.represent_str(str(data)))
+
 
 def get_new_work_subdirectory(stem='experiment', drc=None, number=1, mkdir=True):
     """Simple function to grab new empty working directory."""
@@ -12,10 +36,15 @@ def get_new_work_subdirectory(stem='experiment', drc=None, number=1, mkdir=True)
     else:
         drc = Path(drc)
 
-    path = drc / f'{stem}_{number}'
-    while path.exists():
+    # list the directory once instead of probing every candidate with `exists`
+    try:
+        existing = {os.path.normcase(p.name) for p in drc.iterdir()}
+    except FileNotFoundError:
+        existing = set()
+
+    while os.path.normcase(f'{stem}_{number}') in existing:
         number += 1
-        path = drc / f'{stem}_{number}'
+    path = drc / f'{stem}_{number}'
 
     if mkdir:
         path.mkdir(exist_ok=True, parents=True)
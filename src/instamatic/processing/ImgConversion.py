@@ -13,8 +13,8 @@ from instamatic.formats import read_tiff, write_adsc, write_mrc, write_tiff
 from instamatic.processing.flatfield import apply_flatfield_correction
 from instamatic.processing.stretch_correction import affine_transform_ellipse_to_circle
 from instamatic.tools import (
-    find_beam_center,
     find_beam_center_with_beamstop,
+    find_beam_centers,
     find_subranges,
     to_xds_untrusted_area,
 )
@@ -136,20 +136,18 @@ class ImgConversion:
             flatfield, h = read_tiff(flatfield)
         self.flatfield = flatfield
 
-        self.headers = {}
-        self.data = {}
-
         self.smv_subdrc = 'data'
 
-        while len(buffer) != 0:
-            i, img, h = buffer.pop(0)
+        indices, imgs, headers = zip(*buffer)
+        buffer.clear()
 
-            self.headers[i] = h
+        # stack the frames so that the flatfield is applied in a single pass
+        imgs = np.stack(imgs)
+        if self.flatfield is not None:
+            imgs = apply_flatfield_correction(imgs, self.flatfield)
 
-            if self.flatfield is not None:
-                self.data[i] = apply_flatfield_correction(img, self.flatfield)
-            else:
-                self.data[i] = img
+        self.headers = dict(zip(indices, headers))
+        self.data = dict(zip(indices, imgs))
 
         self.untrusted_areas = []
 
@@ -157,7 +155,7 @@ class ImgConversion:
         self.complete_range = set(range(min(self.observed_range), max(self.observed_range) + 1))
         self.missing_range = self.observed_range ^ self.complete_range
 
-        self.data_shape = img.shape
+        self.data_shape = imgs.shape[1:]
         try:
             self.pixelsize = config.calibration['diff']['pixelsize'][
                 camera_length
@@ -257,13 +255,14 @@ class ImgConversion:
         """Obtain beam centers from the diffraction data Returns a tuple with
         the median beam center and its standard deviation."""
         shape_x, shape_y = self.data_shape
-        centers = []
-        for i, h in self.headers.items():
-            if self.use_beamstop:
-                cx, cy = find_beam_center_with_beamstop(self.data[i], z=99)
-            else:
-                cx, cy = find_beam_center(self.data[i], sigma=10)
+        imgs = [self.data[i] for i in self.headers]
+        if self.use_beamstop:
+            found = [find_beam_center_with_beamstop(img, z=99) for img in imgs]
+        else:
+            found = find_beam_centers(imgs, sigma=10)
 
+        centers = []
+        for h, (cx, cy) in zip(self.headers.values(), found):
             if invert_x:
                 cx = shape_x - cx
             if invert_y:
@@ -320,39 +319,23 @@ class ImgConversion:
         write_cbf(path / 'XCORR.cbf', np.int32(xcorr * 100))
         write_cbf(path / 'YCORR.cbf', np.int32(ycorr * 100))
 
-    def tiff_writer(self, path: str) -> None:
+    def tiff_writer(self, path: str, workers: int = 8) -> None:
         """Write all data as tiff files to given `path`"""
         print('\033[k', 'Writing TIFF files......', end='\r')
 
-        path.mkdir(exist_ok=True)
-
-        for i in self.observed_range:
-            self.write_tiff(path, i)
-
-        logger.debug(f'Tiff files saved in folder: {path}')
+        self.threadpoolwriter(tiff_path=path, workers=workers)
 
-    def smv_writer(self, path: str) -> None:
+    def smv_writer(self, path: str, workers: int = 8) -> None:
         """Write all data as SMV files compatible with XDS/DIALS to `path`"""
         print('\033[k', 'Writing SMV files......', end='\r')
 
-        path = path / self.smv_subdrc
-        path.mkdir(exist_ok=True)
-
-        for i in self.observed_range:
-            self.write_smv(path, i)
+        self.threadpoolwriter(smv_path=path, workers=workers)
 
-        logger.debug(f'SMV files saved in folder: {path}')
-
-    def mrc_writer(self, path: str) -> None:
+    def mrc_writer(self, path: str, workers: int = 8) -> None:
         """Write all data as mrc files to `path`"""
         print('\033[k', 'Writing MRC files......', end='\r')
 
-        path.mkdir(exist_ok=True)
-
-        for i in self.observed_range:
-            self.write_mrc(path, i)
-
-        logger.debug(f'MRC files created in folder: {path}')
+        self.threadpoolwriter(mrc_path=path, workers=workers)
 
     def threadpoolwriter(
         self,
@@ -528,10 +511,9 @@ class ImgConversion:
             maxval = np.iinfo(dtype).max
             img = (img / dynamic_range) * maxval
 
-        img = np.round(img, 0).astype(dtype)
-
         # flip up/down because RED reads images from the bottom left corner
-        img = np.flipud(img)
+        # flip before the cast, so that the cast produces the contiguous array to write
+        img = np.flipud(np.round(img, 0)).astype(dtype)
 
         write_mrc(fn, img)
 
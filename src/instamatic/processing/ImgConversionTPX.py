@@ -31,9 +31,6 @@ class ImgConversionTPX(ImgConversion):
             flatfield, h = read_tiff(flatfield)
         self.flatfield = flatfield
 
-        self.headers = {}
-        self.data = {}
-
         self.smv_subdrc = 'data'
 
         self.untrusted_areas = [
@@ -41,21 +38,22 @@ class ImgConversionTPX(ImgConversion):
             ('rectangle', ((255, 0), (262, 517))),
         ]
 
-        while len(buffer) != 0:
-            i, img, h = buffer.pop(0)
+        indices, imgs, headers = zip(*buffer)
+        buffer.clear()
 
-            self.headers[i] = h
+        # stack the frames so that the flatfield is applied in a single pass
+        imgs = np.stack(imgs)
+        if self.flatfield is not None:
+            imgs = apply_flatfield_correction(imgs, self.flatfield)
 
-            if self.flatfield is not None:
-                self.data[i] = apply_flatfield_correction(img, self.flatfield)
-            else:
-                self.data[i] = img
+        self.headers = dict(zip(indices, headers))
+        self.data = dict(zip(indices, imgs))
 
         self.observed_range = set(self.data.keys())
         self.complete_range = set(range(min(self.observed_range), max(self.observed_range) + 1))
         self.missing_range = self.observed_range ^ self.complete_range
 
-        self.data_shape = img.shape
+        self.data_shape = imgs.shape[1:]
 
         self.pixelsize = pixelsize
         self.physical_pixelsize = physical_pixelsize
@@ -2,5 +2,22 @@
 
 from __future__ import annotations
 
-from .flatfield import apply_flatfield_correction
-from .stretch_correction import apply_stretch_correction
+from typing import TYPE_CHECKING
+
+from instamatic.utils.lazy import attach
+
+if TYPE_CHECKING:
+    from .flatfield import apply_flatfield_correction
+    from .stretch_correction import apply_stretch_correction
+
+__all__ = [
+    'apply_flatfield_correction',
+    'apply_stretch_correction',
+]
+
+_lazy_attrs = {
+    'apply_flatfield_correction': '.flatfield',
+    'apply_stretch_correction': '.stretch_correction',
+}
+
+__getattr__, __dir__ = attach(__name__, _lazy_attrs)
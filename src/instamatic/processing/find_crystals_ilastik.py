@@ -8,6 +8,7 @@ import yaml
 
 from instamatic import config
 from instamatic.config import defaults
+from instamatic.io import SafeDumper
 
 
 def make_map_scale_ind_yaml(fn: str = 'MapScaleInd.yaml'):
@@ -51,15 +52,59 @@ class CrystalFinder:
         """
         drc = Path(drc)
         with open(drc / fn, 'w') as f:
-            yaml.dump(self.metadata, stream=f)
+            yaml.dump(self.metadata, stream=f, Dumper=SafeDumper)
+
+    def read_metadata(self, fn='settings.yaml', drc='.') -> dict:
+        """Read metadata stored by `write_metadata`.
+
+        Returns an empty dict if the file does not exist or cannot be
+        parsed.
+        """
+        try:
+            with open(Path(drc) / fn) as f:
+                metadata = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError):
+            metadata = None
+
+        return metadata if isinstance(metadata, dict) else {}
+
+    def get_source_key(self, classifier) -> dict:
+        """Identify the input of `convert_to_tiff` by the nav/mrc files, their
+        modification times, and the classifier."""
+        return {
+            'nav': str(self.nav),
+            'nav mtime': self.nav.stat().st_mtime_ns,
+            'mrc': str(self.mrc),
+            'mrc mtime': self.mrc.stat().st_mtime_ns,
+            'classifier': str(classifier),
+        }
+
+    def convert_to_tiff(self, classifier, overwrite: bool = False):
+        """Convert mrc file to tiff files compatible with `Ilastik`
+
+        The conversion is skipped if the metadata from a previous run
+        were generated from the same (unchanged) nav/mrc files and the
+        tiff folder still contains the tiff files, unless `overwrite` is
+        set.
+        """
+        source_key = self.get_source_key(classifier)
+        metadata = self.read_metadata()
+
+        if (
+            not overwrite
+            and metadata.get('source key') == source_key
+            and 'tiff folder' in metadata
+            and any(Path(metadata['tiff folder']).glob('*.tif*'))
+        ):
+            print(f'Reusing tiff files in `{metadata["tiff folder"]}`')
+        else:
+            metadata = predicrystal.generate_test_data(
+                nav=self.nav,
+                mrc=self.mrc,
+                classifier=classifier,
+            )
+            metadata['source key'] = source_key
 
-    def convert_to_tiff(self, classifier):
-        """Convert mrc file to tiff files compatible with `Ilastik`"""
-        metadata = predicrystal.generate_test_data(
-            nav=self.nav,
-            mrc=self.mrc,
-            classifier=classifier,
-        )
         self.metadata = metadata
 
         self.scaling_factor = metadata['scaling factor']
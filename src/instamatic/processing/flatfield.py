@@ -60,14 +60,17 @@ def apply_flatfield_correction(img, flatfield, darkfield=None):
     """Apply flatfield correction to image.
 
     https://en.wikipedia.org/wiki/Flat-field_correction
+
+    `img` can also be a stack of images with shape (N, *flatfield.shape),
+    in which case the correction is broadcast over all frames at once.
     """
-    if flatfield.shape != img.shape:
+    if flatfield.shape != img.shape[-flatfield.ndim :]:
         msg = f'Flatfield not applied: image {img.shape} and flatfield {flatfield.shape} do not match shapes.'
         warnings.warn(msg)
         return img
 
     if darkfield is None:
-        ret = img * np.mean(flatfield) / flatfield
+        ret = img * (np.mean(flatfield) / flatfield)
     else:
         gain = np.mean(flatfield - darkfield) / (flatfield - darkfield)
         ret = (img - darkfield) * gain
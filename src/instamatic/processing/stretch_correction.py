@@ -3,9 +3,7 @@ from __future__ import annotations
 import math
 import sys
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.widgets import Slider
 from scipy.ndimage import interpolation, morphology
 from skimage.feature import canny
 from skimage.measure import label, regionprops
@@ -104,6 +102,9 @@ def make_title(prop):
 def get_sigma_interactive(img, sigma=20):
     """Interactive function to get the sigma threshold value for the edge
     detection."""
+    import matplotlib.pyplot as plt
+    from matplotlib.widgets import Slider
+
     edges = canny(img, sigma=sigma, low_threshold=None, high_threshold=None)
 
     fig, ax = plt.subplots()
@@ -151,6 +152,8 @@ def get_sigma_interactive(img, sigma=20):
 
 def plot_props(edges, props):
     """Plot the ring structures."""
+    import matplotlib.pyplot as plt
+
     plt.imshow(edges)
     for prop in props:
         print('centroid = ({:.2f}, {:.2f})'.format(*prop.centroid))
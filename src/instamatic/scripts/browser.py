@@ -4,6 +4,7 @@ import argparse
 import glob
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import matplotlib
@@ -21,15 +22,31 @@ ANGLE = -0.88 + np.pi / 2
 R = np.array([[np.cos(ANGLE), -np.sin(ANGLE)], [np.sin(ANGLE), np.cos(ANGLE)]])
 
 
+def read_header_only(fn):
+    """Same signature as `read_image`, but without reading the image data."""
+    return None, read_image_header(fn)
+
+
+def read_thumbnail(fn):
+    """Same signature as `read_image`, but returns the image scaled down for
+    stitching, so that the full images do not have to be kept in memory."""
+    img, h = read_image(fn)
+    return ndimage.zoom(img, 0.0969), h
+
+
 def get_stage_coords(fns, return_ims=False):
     coords = []
     has_crystals = []
-    t = tqdm(fns, desc='Parsing files')
 
     imgs = []
 
-    for fn in t:
-        img, h = read_image(fn)
+    # the image data are only needed for stitching
+    reader = read_thumbnail if return_ims else read_header_only
+
+    with ThreadPoolExecutor() as executor:
+        results = list(tqdm(executor.map(reader, fns), total=len(fns), desc='Parsing files'))
+
+    for img, h in results:
         try:
             dx, dy = h['exp_hole_offset']
             cx, cy = h['exp_hole_center']
@@ -40,7 +57,6 @@ def get_stage_coords(fns, return_ims=False):
 
         has_crystals.append(len(h['exp_crystal_coords']) > 0)
         if return_ims:
-            img = ndimage.zoom(img, 0.0969)
             imgs.append(img)
     # convert to um
 
@@ -147,22 +163,20 @@ def run(filepat='images/image_*.tiff', results=None, stitch=False):
             crystal_coords = np.array(h['exp_crystal_coords'])
 
             if results:
+                # relative paths to match `df.index`
+                prefix = os.path.relpath(fn.parents[1] / 'data' / fn.stem)
                 crystal_fns = [
-                    fn.parents[1] / 'data' / f'{fn.stem}_{i:04d}{fn.suffix}'
-                    for i in range(len(crystal_coords))
+                    f'{prefix}_{i:04d}{fn.suffix}' for i in range(len(crystal_coords))
                 ]
-                df.ix[crystal_fns]
-
-                for coord, crystal_fn in zip(crystal_coords, crystal_fns):
-                    try:
-                        phase, score = df.ix[crystal_fn, 'phase'], df.ix[crystal_fn, 'score']
+                # rows for crystal_fn not in df.index are filled with NaN
+                crystal_results = df.reindex(crystal_fns, columns=['phase', 'score'])
 
-                    except KeyError:  # if crystal_fn not in df.index
-                        pass
-                    else:
-                        if score > 10:
-                            text = f' {phase}\n {score:.0f}'
-                            ax2.text(coord[1], coord[0], text)
+                for coord, (phase, score) in zip(
+                    crystal_coords, crystal_results.itertuples(index=False)
+                ):
+                    if score > 10:  # False for NaN
+                        text = f' {phase}\n {score:.0f}'
+                        ax2.text(coord[1], coord[0], text)
 
             if len(crystal_coords) > 0:
                 plt_crystals.set_xdata(crystal_coords[:, 1])
@@ -205,7 +219,7 @@ def run(filepat='images/image_*.tiff', results=None, stitch=False):
                     plt_diff.data = None
 
                 try:
-                    r = df.ix[fn_diff]
+                    r = df.loc[os.path.relpath(fn_diff)]
                 except KeyError:
                     plt_diff.center.set_xdata([])
                     plt_diff.center.set_ydata([])
@@ -6,9 +6,7 @@ import sys
 from pathlib import Path
 
 import numpy as np
-from scipy import interpolate, ndimage
-from skimage import exposure
-from skimage.measure import regionprops
+from scipy import ndimage
 
 
 def prepare_grid_coordinates(nx: int, ny: int, stepsize: float = 1.0) -> 'np.array':
@@ -97,6 +95,14 @@ def find_peak_max(
     y1 = ndimage.gaussian_filter1d(arr, sigma)
     c1 = np.argmax(y1)  # initial guess for beam center
 
+    return _refine_peak_max(y1, c1, m=m, w=w, kind=kind)
+
+
+def _refine_peak_max(y1: np.ndarray, c1: int, m: int, w: int, kind: int) -> float:
+    """Refine the peak position `c1` in the smoothed 1D pattern `y1` to
+    subpixel precision, see `find_peak_max`."""
+    from scipy import interpolate
+
     win_len = 2 * w + 1
 
     try:
@@ -131,6 +137,35 @@ def find_beam_center(
     return center
 
 
+def find_beam_centers(
+    imgs: np.ndarray, sigma: int = 30, m: int = 100, kind: int = 3
+) -> np.ndarray:
+    """Find the center of the primary beam in each image of the stack `imgs`,
+    see `find_beam_center`.
+
+    The X/Y projections of all images are smoothed in a single call, so
+    that only the subpixel interpolation is done image by image. Returns
+    an array of shape (N, 2).
+    """
+    xx = np.array([np.sum(img, axis=1) for img in imgs])
+    yy = np.array([np.sum(img, axis=0) for img in imgs])
+
+    xx = ndimage.gaussian_filter1d(xx, sigma, axis=1)
+    yy = ndimage.gaussian_filter1d(yy, sigma, axis=1)
+
+    cxs = np.argmax(xx, axis=1)
+    cys = np.argmax(yy, axis=1)
+
+    centers = [
+        (
+            _refine_peak_max(x, cx, m=m, w=10, kind=kind),
+            _refine_peak_max(y, cy, m=m, w=10, kind=kind),
+        )
+        for x, y, cx, cy in zip(xx, yy, cxs, cys)
+    ]
+    return np.array(centers)
+
+
 def find_beam_center_with_beamstop(
     img, z: int = None, method='thresh', plot=False
 ) -> (float, float):
@@ -149,12 +184,21 @@ def find_beam_center_with_beamstop(
         gauss: standard deviation for the gaussian blurring (50)
     """
     if method == 'gauss':
+        from scipy import signal
+
         if not z:
             z = 50
-        blurred = ndimage.filters.gaussian_filter(img, z)
-        cx, cy = np.unravel_index(blurred.argmax(), blurred.shape)
+        # single precision and a 3 sigma kernel are sufficient to locate the maximum
+        # the kernel is large, so convolve via FFT, pad to match `gaussian_filter` (reflect)
+        r = int(3 * z)
+        g = signal.windows.gaussian(2 * r + 1, z).astype(np.float32)
+        padded = np.pad(img.astype(np.float32, copy=False), r, mode='symmetric')
+        blurred = signal.fftconvolve(padded, np.outer(g, g), mode='valid')
+        dx, dy = np.unravel_index(blurred.argmax(), blurred.shape)
 
     elif method == 'thresh':
+        from skimage.measure import regionprops
+
         if not z:
             z = 99
         seg = img > np.percentile(img, z)
@@ -0,0 +1,44 @@
+"""Lazy resolution of package attributes."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+
+def attach(package: str, lazy_attrs: dict):
+    """Make the public names of `package` resolve on first access (PEP 562),
+    so that importing one submodule, e.g. via a console script, does not pull
+    in the others.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, i.e. `__name__`
+    lazy_attrs : dict
+        Mapping of attribute name to the (relative) module that defines it
+
+    Returns
+    -------
+    __getattr__, __dir__ : callable
+        Module-level functions to assign in the package `__init__.py`
+
+    Notes
+    -----
+    Type checkers and IDEs do not see names resolved this way, so the package
+    should import the same names under an `if TYPE_CHECKING:` block.
+    """
+
+    def __getattr__(name: str):
+        try:
+            module = lazy_attrs[name]
+        except KeyError:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}') from None
+        attr = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, attr)
+        return attr
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(lazy_attrs))
+
+    return __getattr__, __dir__
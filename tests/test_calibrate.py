@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import fft
+from skimage.registration import phase_cross_correlation
+
+from instamatic.calibrate.calibrate_stagematrix import (
+    cross_correlate_image_pairs,
+    rfft_translation,
+)
+
+
+@pytest.mark.parametrize('shape', [(64, 64), (63, 65), (65, 64)])
+def test_rfft_translation(shape):
+    rng = np.random.default_rng(0)
+    a = rng.random(shape)
+
+    ny, nx = shape
+    shifts = [
+        (0, 0),
+        (3, -5),
+        (ny // 2, nx // 2),
+        (-(ny // 2), -(nx // 2)),
+        (ny // 2 - 1, -(nx // 2) + 1),
+        ((ny - 1) // 2, -((nx - 1) // 2)),
+    ]
+
+    for shift in shifts:
+        b = np.roll(a, shift, axis=(0, 1))
+
+        expected, _, _ = phase_cross_correlation(a, b, upsample_factor=1)
+        translation = rfft_translation(fft.rfft2(a), fft.rfft2(b), shape)
+
+        np.testing.assert_array_equal(translation, expected)
+
+
+def test_cross_correlate_image_pairs():
+    rng = np.random.default_rng(1)
+    img0 = rng.random((64, 64))
+    img1 = np.roll(img0, (4, -7), axis=(0, 1))
+    img2 = np.roll(img1, (-2, 3), axis=(0, 1))
+    pairs = ((img0, img1), (img1, img2))
+
+    for upsample_factor in (1, 10):
+        translations = cross_correlate_image_pairs(pairs, upsample_factor=upsample_factor)
+        np.testing.assert_allclose(translations, [(-4, 7), (2, -3)])
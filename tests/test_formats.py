@@ -91,3 +91,20 @@ def test_read(format, write_func, with_header, raises, data, header, temp_data_f
         # Check if the header we want is in the header we read
         if not all(str(v) == str(h.get(k)) for k, v in header.items()):
             raise ValueError('Header mismatch')
+
+
+@pytest.mark.parametrize(
+    ['format', 'write_func'],
+    [
+        ('tiff', formats.write_tiff),
+        ('h5', formats.write_hdf5),
+        ('img', formats.write_adsc),
+    ],
+)
+def test_read_header(format, write_func, data, header, temp_data_file):
+    out = temp_data_file + 'header.' + format
+    write_func(out, data, header)
+
+    _, h = formats.read_image(out)
+
+    assert formats.read_image_header(out) == h
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+from instamatic.io import SafeDumper, get_new_work_subdirectory
+
+
+def test_safe_dumper():
+    d = {
+        'translations': np.array([[1.5, 2.0], [3.0, 4.0]]),
+        'stage_x': np.float64(1.5),
+        'binning': np.int32(2),
+        'args': ((3, [np.float64(10000.0), 0.0]),),
+        'drc': Path('some') / 'path',
+    }
+
+    s = yaml.dump(d, Dumper=SafeDumper)
+
+    assert yaml.safe_load(s) == {
+        'translations': [[1.5, 2.0], [3.0, 4.0]],
+        'stage_x': 1.5,
+        'binning': 2,
+        'args': [[3, [10000.0, 0.0]]],
+        'drc': str(Path('some') / 'path'),
+    }
+
+
+def test_get_new_work_subdirectory(tmp_path):
+    (tmp_path / 'experiment_1').mkdir()
+    (tmp_path / 'experiment_2').touch()
+    (tmp_path / 'experiment_4').mkdir()
+
+    path = get_new_work_subdirectory(drc=tmp_path)
+    assert path == tmp_path / 'experiment_3'
+    assert path.is_dir()
+
+    path = get_new_work_subdirectory(drc=tmp_path)
+    assert path == tmp_path / 'experiment_5'
+
+    path = get_new_work_subdirectory(stem='other', drc=tmp_path / 'new', mkdir=False)
+    assert path == tmp_path / 'new' / 'other_1'
+    assert not path.exists()
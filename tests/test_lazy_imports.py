@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize('package', ['instamatic.calibrate', 'instamatic.processing'])
+def test_lazy_attrs(package):
+    mod = importlib.import_module(package)
+
+    assert sorted(mod.__all__) == sorted(mod._lazy_attrs)
+    assert set(mod.__all__) <= set(dir(mod))
+
+    # the `TYPE_CHECKING` imports must mirror the lazy mapping
+    tree = ast.parse(Path(mod.__file__).read_text())
+    block = next(node for node in tree.body if isinstance(node, ast.If))
+    type_checking = {
+        alias.name: '.' + node.module for node in block.body for alias in node.names
+    }
+    assert type_checking == mod._lazy_attrs
+
+    for name, module in mod._lazy_attrs.items():
+        obj = getattr(mod, name)
+        assert obj.__module__ == package + module
+
+    with pytest.raises(AttributeError):
+        mod.does_not_exist
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import numpy as np
+
+from instamatic import tools
+
+
+def test_find_beam_centers():
+    rng = np.random.default_rng(0)
+    imgs = rng.poisson(5, size=(3, 128, 128)).astype(np.uint16)
+    for img, (x, y) in zip(imgs, ((40, 80), (64, 64), (90, 30))):
+        img[x - 3 : x + 3, y - 3 : y + 3] += 500
+
+    centers = tools.find_beam_centers(imgs, sigma=10)
+
+    assert centers.shape == (3, 2)
+    for img, center in zip(imgs, centers):
+        np.testing.assert_allclose(center, tools.find_beam_center(img, sigma=10))
+
+
+def test_find_beam_center_with_beamstop_gauss():
+    yy, xx = np.mgrid[:256, :256]
+    img = 1000 * np.exp(-((yy - 100) ** 2 + (xx - 140) ** 2) / (2 * 20**2))
+    img[95:105, :140] = 0  # beamstop
+
+    center = tools.find_beam_center_with_beamstop(img, z=20, method='gauss')
+
+    np.testing.assert_allclose(center, (100, 140), atol=3)